@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+import pandas as pd
+from datetime import datetime
+from config import Config
+from mock_server import MockJobBoard, StandInProxy
+
+# Scraper script and output file for every site, keyed by its mock board prefix
+scrapers = {
+    'indeed': ('indeed.py', Config.output_csv_indeed),
+    'ziprecruiter': ('zipRecruiter.py', Config.output_csv_zip),
+    'careerbuilder': ('career_builder.py', Config.output_csv_career),
+    'dice': ('dice.py', Config.output_csv_dice),
+}
+
+def count_rows(path):
+    return len(pd.read_csv(path)) if os.path.exists(path) else 0
+
+def finish(start, process):
+    _, stderr = process.communicate()
+    return time.perf_counter() - start, process.returncode, stderr
+
+def run_scrapers(sites, base_url, output_directory, parallel=False, proxies=None):
+    # Run the real scraper scripts against the mock board, through the given stand-in proxies if any, and time each of them
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, SCRAPER_BASE_URL=base_url, SCRAPER_OUTPUT_DIR=output_directory)
+    env.pop('SCRAPER_PROXIES', None)
+    if proxies:
+        env['SCRAPER_PROXIES'] = ','.join(proxies)
+    output_path = os.path.join(output_directory, datetime.now().strftime('%Y-%m-%d'))
+
+    started = {}
+    for site in sites:
+        started[site] = (time.perf_counter(), subprocess.Popen(
+            [sys.executable, scrapers[site][0]], cwd=here, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        ))
+        if not parallel:
+            started[site] = finish(*started[site])
+
+    results = {}
+    for site in sites:
+        if parallel:
+            started[site] = finish(*started[site])
+        seconds, returncode, stderr = started[site]
+        results[site] = {
+            'seconds': seconds,
+            'returncode': returncode,
+            'rows': count_rows(os.path.join(output_path, scrapers[site][1])),
+            'error': stderr.strip().splitlines()[-1] if returncode and stderr.strip() else '',
+        }
+    return results
+
+def print_report(results, stats):
+    print(f"{'site':<14}{'seconds':>9}{'requests':>10}{'req/s':>8}{'429':>6}{'5xx':>6}{'rows':>7}  status")
+    for site, result in results.items():
+        site_stats = stats.get(site, {})
+        requests_served = sum(site_stats.values())
+        rate = requests_served / result['seconds'] if result['seconds'] else 0
+        status = 'ok' if result['returncode'] == 0 else f"exit {result['returncode']}: {result['error']}"
+        print(f"{site:<14}{result['seconds']:>9.2f}{requests_served:>10}{rate:>8.1f}"
+              f"{site_stats.get(429, 0):>6}{site_stats.get(500, 0):>6}{result['rows']:>7}  {status}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run the scrapers end to end against the local mock job board')
+    parser.add_argument('--sites', nargs='+', choices=list(scrapers), default=list(scrapers))
+    parser.add_argument('--latency', type=float, default=0.05, help='mean response delay in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with 500')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='share of requests answered with 429')
+    parser.add_argument('--fixtures', help='directory with recorded <site>.html / dice.json pages to serve instead')
+    parser.add_argument('--parallel', action='store_true', help='run all scrapers at the same time')
+    parser.add_argument('--output', help='where the scrapers write their CSVs (default: a temporary directory)')
+    parser.add_argument('--proxies', type=int, default=0, help='route the scrapers through this many local stand-in proxies')
+    parser.add_argument('--failing-proxies', type=int, default=0, help='how many of the stand-in proxies answer every request with 502')
+    args = parser.parse_args()
+
+    board = MockJobBoard(latency=args.latency, error_rate=args.error_rate, rate_429=args.rate_429, fixtures=args.fixtures, seed=0)
+    base_url = board.start()
+    print(f'Mock job board running on {base_url}')
+    stand_ins = [StandInProxy(fail_status=502 if i < args.failing_proxies else None) for i in range(args.proxies)]
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        results = run_scrapers(args.sites, base_url, args.output or temporary_directory, args.parallel, [p.start() for p in stand_ins])
+    board.stop()
+    print_report(results, board.stats)
+
+    for proxy in stand_ins:
+        print(f"stand-in proxy {proxy.url}{' (failing)' if proxy.fail_status else ''}: forwarded {proxy.forwarded} requests")
+        proxy.stop()
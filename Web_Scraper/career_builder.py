@@ -9,6 +9,8 @@ import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
 from config import Config
+from proxy_pool import ProxyPool
+from classifier import filter_postings
 from datetime import datetime, timedelta
 
 # Suppress warnings
@@ -24,8 +26,7 @@ warnings.filterwarnings('ignore')
 # Randomly select a user-agent
 user_agent = random.choice(Config.USER_AGENT_LIST)
 headers = {'User-Agent': user_agent}
-proxy = Config.proxy
-proxies = {"http": proxy, "https": proxy}
+pool = ProxyPool(Config.proxies)
 
 # Function to categorize work type based on title
 def categorize_work_type(title):
@@ -78,7 +79,7 @@ def get_data(soup):
                     job_data['location'] = inner_soup.find('div', class_='data-details').find_all('span')[1].text.strip()
                     job_data['employment_type'] = inner_soup.find('div', class_='data-details').find_all('span')[2].text.strip()
                     job_url = inner_listing.find('a', class_='data-results-content')['href']
-                    job_data['url'] = f"https://www.careerbuilder.com{job_url}"
+                    job_data['url'] = f"{Config.base_url_career}{job_url}"
                     result = inner_soup.select('div.block:not(.show-mobile)')
                     job_data['result'] = result[0].get_text(strip=True)
 
@@ -130,9 +131,6 @@ output_file_path = os.path.join(output_path, output_filename)
 dfs = []
 soups = []
 
-# Create a session to reuse the same connection
-session = requests.Session()
-
 try:
     for keyword in Config.keywords:
         keyword_lower = keyword.lower()
@@ -141,7 +139,7 @@ try:
             url = Config.url_career.format(keyword=keyword_lower.replace(" ", "%20"), page=u)
 
             try:
-                response = session.get(url, headers=headers, proxies=proxies, verify=False)
+                response = pool.get(url, headers=headers, verify=False)
                 response.raise_for_status()
 
                 if response.status_code == 200:
@@ -158,6 +156,7 @@ try:
                     print('Sorry, but the bot did not find proper data on this page')
                     continue
 
+                result_df['Keyword'] = keyword
                 dfs.append(result_df)
                 print(f'Success for the page: {u}')
 
@@ -167,13 +166,15 @@ try:
             except Exception as e:
                 print(f'Error for page {u}: {e}')
 
-            time.sleep(5)
+            time.sleep(Config.request_delay)
 
 except Exception as e:
     print(f'An unexpected error occurred: {e}')
 
 # Concatenate dataframes
 final_df = pd.concat(dfs, ignore_index=True)
+final_df = filter_postings(final_df, 'Title', 'Keyword', 'Job_type')
+final_df.drop(columns='Keyword', inplace=True)
 final_df.drop_duplicates(inplace=True)
 
 # Save the data to the specified file path
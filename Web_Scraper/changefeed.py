@@ -0,0 +1,152 @@
+import os
+import re
+import pandas as pd
+from config import Config
+
+# Layout of every site's snapshot file: the job id, title and pay columns, plus the
+# volatile columns that change on every run even when the posting itself did not
+# (run timestamps, Indeed's tracking links, CareerBuilder's dates derived from "N days ago").
+# Multi-value columns list the same values in varying order between runs, so they are compared as sorted sets
+site_columns = {
+    'Indeed': {
+        'file': Config.output_csv_indeed,
+        'id': 'Job ID',
+        'title': 'Title',
+        'pay': 'Salary',
+        'volatile': ['Current Date Time', 'Job Link'],
+    },
+    'ZipRecruiter': {
+        'file': Config.output_csv_zip,
+        'id': 'JobID',
+        'title': 'Title',
+        'pay': 'Salary',
+        'volatile': ['Current_Date_Time'],
+    },
+    'CareerBuilder': {
+        'file': Config.output_csv_career,
+        'id': 'Job_id',
+        'title': 'Title',
+        'pay': 'Salary',
+        'volatile': ['Current Date', 'Date Posted'],
+    },
+    'Dice': {
+        'file': Config.output_csv_dice,
+        'id': 'Job_id',
+        'title': 'Job title',
+        'pay': 'Pay rate',
+        'volatile': ['Current date time', 'Job Title', 'Modified Date'],
+        'multi_value': ['Job type'],
+    },
+}
+
+changefeed_columns = ['Site', 'Change', 'Job ID', 'Title', 'Old Pay', 'New Pay']
+
+def find_previous_snapshot(output_directory, subdirectory):
+    # Latest dated snapshot directory strictly before the given one
+    dates = sorted(
+        name for name in os.listdir(output_directory)
+        if re.fullmatch(r'\d{4}-\d{2}-\d{2}', name) and name < subdirectory
+    )
+    return os.path.join(output_directory, dates[-1]) if dates else None
+
+def read_snapshot(path):
+    # Read a snapshot in chunks, keeping every value as text so hashes are stable between runs
+    return pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=Config.changefeed_chunksize)
+
+def read_header(path):
+    return list(pd.read_csv(path, dtype=str, nrows=0).columns)
+
+def fingerprint(chunk, columns, spec):
+    # Hash the compared columns of every row into a single 64-bit value
+    compared = chunk[columns].copy()
+    for column in spec.get('multi_value', []):
+        if column in compared:
+            compared[column] = compared[column].str.split(',').apply(lambda values: ', '.join(sorted(v.strip() for v in values)))
+    return pd.util.hash_pandas_object(compared, index=False)
+
+def index_snapshot(path, spec, columns):
+    # Map job id -> (row fingerprint, pay) for the previous snapshot, first occurrence wins
+    index = {}
+    for chunk in read_snapshot(path):
+        chunk = chunk.drop_duplicates(subset=spec['id'])
+        for job_id, digest, pay in zip(chunk[spec['id']], fingerprint(chunk, columns, spec), chunk[spec['pay']]):
+            if job_id not in index:
+                index[job_id] = (digest, pay)
+    return index
+
+def diff_site(site, spec, previous_file, current_file):
+    # Yield changefeed chunks for one site without loading either snapshot fully
+    previous_header = read_header(previous_file)
+    columns = [c for c in read_header(current_file) if c in previous_header and c not in spec['volatile']]
+    previous = index_snapshot(previous_file, spec, columns)
+    seen = set()
+
+    for chunk in read_snapshot(current_file):
+        chunk = chunk.drop_duplicates(subset=spec['id'])
+        chunk = chunk[~chunk[spec['id']].isin(seen)]
+        rows = []
+
+        for job_id, title, pay, digest in zip(chunk[spec['id']], chunk[spec['title']], chunk[spec['pay']], fingerprint(chunk, columns, spec)):
+            seen.add(job_id)
+            if job_id not in previous:
+                rows.append((site, 'added', job_id, title, '', pay))
+            elif previous[job_id][1] != pay:
+                rows.append((site, 'pay_changed', job_id, title, previous[job_id][1], pay))
+            elif previous[job_id][0] != digest:
+                rows.append((site, 'modified', job_id, title, previous[job_id][1], pay))
+
+        yield pd.DataFrame(rows, columns=changefeed_columns)
+
+    # Second pass over the previous snapshot only to pick up titles of removed postings
+    removed = previous.keys() - seen
+    for chunk in read_snapshot(previous_file):
+        if not removed:
+            break
+        chunk = chunk[chunk[spec['id']].isin(removed)].drop_duplicates(subset=spec['id'])
+        removed -= set(chunk[spec['id']])
+        yield pd.DataFrame({
+            'Site': site,
+            'Change': 'removed',
+            'Job ID': chunk[spec['id']],
+            'Title': chunk[spec['title']],
+            'Old Pay': chunk[spec['pay']],
+            'New Pay': '',
+        }, columns=changefeed_columns)
+
+def build_changefeed(previous_path, current_path):
+    # Write the added/removed/pay_changed/modified postings of every site to the current snapshot directory.
+    # 'modified' only covers postings whose pay stayed the same but another compared column changed
+    output_path = os.path.join(current_path, Config.output_csv_changefeed)
+    pd.DataFrame(columns=changefeed_columns).to_csv(output_path, index=False)
+    counts = {}
+
+    for site, spec in site_columns.items():
+        previous_file = os.path.join(previous_path, spec['file'])
+        current_file = os.path.join(current_path, spec['file'])
+
+        if not (os.path.exists(previous_file) and os.path.exists(current_file)):
+            print(f"Skipping {site}: no snapshot to compare in both {previous_path} and {current_path}")
+            continue
+
+        counts[site] = {'added': 0, 'removed': 0, 'pay_changed': 0, 'modified': 0}
+        for changes in diff_site(site, spec, previous_file, current_file):
+            if changes.empty:
+                continue
+            for change, count in changes['Change'].value_counts().items():
+                counts[site][change] += count
+            changes.to_csv(output_path, mode='a', header=False, index=False)
+
+    return output_path, counts
+
+if __name__ == "__main__":
+    current_path = Config.output_csv_path2
+    previous_path = find_previous_snapshot(Config.output_directory, Config.subdirectory)
+
+    if previous_path is None or not os.path.isdir(current_path):
+        print(f"Sorry, there is no earlier snapshot to compare {current_path} with")
+    else:
+        output_path, counts = build_changefeed(previous_path, current_path)
+        for site, site_counts in counts.items():
+            print(f"{site}: {site_counts['added']} added, {site_counts['removed']} removed, "
+                  f"{site_counts['pay_changed']} pay changed, {site_counts['modified']} modified")
+        print(f'Successfully saved the changefeed to {output_path}')
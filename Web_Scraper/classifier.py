@@ -0,0 +1,137 @@
+import re
+import numpy as np
+import pandas as pd
+from config import Config
+
+# Normalized contract types, checked in order so "Full-time, Contract" counts as Contract
+contract_type_patterns = [
+    ('Contract', r'contract|third party|corp[\s-]?to[\s-]?corp|\bc2c\b|temporary|\btemp\b|freelance|\b1099\b'),
+    ('Part-time', r'part[\s-]?time'),
+    ('Full-time', r'full[\s-]?time|permanent'),
+]
+
+# Extra title patterns that count as a match for a searched keyword (acronyms, common variants)
+keyword_synonyms = {
+    'business analyst': [r'\bbsa\b', r'\bba\b', r'business (?:systems? )?analyst'],
+    'business system analyst': [r'\bbsa\b', r'business systems? analyst'],
+    'system analyst': [r'systems? analyst'],
+    'data scientists': [r'data scien', r'machine learning', r'\bml\b'],
+    'data engineer': [r'data engineer', r'\betl\b'],
+}
+
+# Deny list from Config; known junk scores 0 before the keyword match is applied
+unrelated_titles = re.compile('|'.join(f'(?:{p})' for p in Config.unrelated_title_patterns), re.I)
+
+def normalize_contract_type(job_types):
+    # Map every site's employment type spelling onto Contract / Part-time / Full-time in one pass
+    job_types = job_types.fillna('').astype(str)
+    conditions = [job_types.str.contains(pattern, case=False, regex=True) for _, pattern in contract_type_patterns]
+    return pd.Series(np.select(conditions, [label for label, _ in contract_type_patterns], default=None), index=job_types.index)
+
+def stem(word):
+    # Drop a trailing plural "s" so "Scientists" matches "Scientist" and "Systems" matches "System"
+    return word[:-1] if len(word) > 3 and word.endswith('s') and not word.endswith('ss') else word
+
+def tokenize(texts):
+    return texts.fillna('').astype(str).str.lower().str.findall(r'[a-z0-9]+').apply(lambda words: [stem(w) for w in words])
+
+def trigrams(word):
+    return [f' {word} '[i:i + 3] for i in range(len(word))]
+
+def hashed_trigrams(words):
+    # Distinct (word, feature) pairs of the character trigrams of every word, hashed into Config.classifier_features buckets
+    grams = [trigrams(word) for word in words]
+    rows = np.repeat(np.arange(len(words)), [len(g) for g in grams])
+    flat = np.array([g for word_grams in grams for g in word_grams], dtype=object)
+    features = (pd.util.hash_array(flat) % Config.classifier_features).astype(np.int64) if len(flat) else np.zeros(0, np.int64)
+
+    keys = np.unique(rows * Config.classifier_features + features)
+    return keys // Config.classifier_features, keys % Config.classifier_features
+
+def trigram_similarity(words, targets):
+    # Dice coefficient of the character trigrams of every word against every target word, shape (len(words), len(targets))
+    word_rows, word_features = hashed_trigrams(words)
+    target_rows, target_features = hashed_trigrams(targets)
+    word_sizes = np.bincount(word_rows, minlength=len(words))
+    target_sizes = np.bincount(target_rows, minlength=len(targets))
+
+    similarity = np.zeros((len(words), len(targets)))
+    for target in range(len(targets)):
+        shared = np.isin(word_features, target_features[target_rows == target])
+        similarity[:, target] = 2 * np.bincount(word_rows[shared], minlength=len(words)) / (word_sizes + target_sizes[target])
+    return similarity
+
+def relevance_scores(titles, keywords):
+    # Share of its keyword's words every title covers. Scores depend only on the title and keyword, not on the rest of the batch.
+    # Generic role words (Config.generic_title_words) only count for titles that also match a distinctive keyword word
+    unique_keywords, keyword_ids = np.unique(keywords.fillna('').astype(str).to_numpy(), return_inverse=True)
+    title_tokens = tokenize(titles)
+    keyword_tokens = tokenize(pd.Series(unique_keywords))
+    flat = np.array([w for words in title_tokens for w in words], dtype=object)
+    keyword_words = sorted({w for words in keyword_tokens for w in words})
+    scores = np.zeros(len(titles))
+    if not len(flat) or not keyword_words:
+        return scores
+
+    # Best match of every keyword word among the words of every title, weak matches counting as none
+    title_words, word_ids = np.unique(flat, return_inverse=True)
+    title_rows = np.repeat(np.arange(len(titles)), title_tokens.str.len().to_numpy())
+    similarity = trigram_similarity(title_words, keyword_words)
+    similarity = np.where(similarity >= Config.word_match_similarity, similarity, 0.0)
+    best = np.zeros((len(titles), len(keyword_words)))
+    np.maximum.at(best, title_rows, similarity[word_ids])
+
+    generic_words = {stem(w) for w in Config.generic_title_words}
+    for keyword_id, words in enumerate(keyword_tokens):
+        if not words:
+            continue
+        rows = keyword_ids == keyword_id
+        matched = best[np.ix_(rows, [keyword_words.index(w) for w in words])]
+        generic = np.array([w in generic_words for w in words])
+        if generic.all():
+            # A keyword made only of generic words ("Analyst") has nothing else to anchor on
+            generic[:] = False
+        anchored = matched[:, ~generic].max(axis=1) > 0
+        scores[rows] = (matched[:, ~generic].sum(axis=1) + anchored * matched[:, generic].sum(axis=1)) / len(words)
+
+    return scores
+
+def keyword_matches(titles, keywords):
+    # Titles that contain every word of their keyword, or one of its synonyms
+    titles = titles.fillna('').astype(str)
+    keywords = keywords.fillna('').astype(str)
+    matches = np.zeros(len(titles), bool)
+
+    for keyword in keywords.unique():
+        words = [stem(w) for w in re.findall(r'[a-z0-9]+', keyword.lower())]
+        patterns = [''.join(rf'(?=.*\b{re.escape(w)})' for w in words)] + keyword_synonyms.get(keyword.lower(), [])
+        mask = (keywords == keyword).to_numpy()
+        matches[mask] = titles[mask].str.contains('|'.join(f'(?:{p})' for p in patterns), case=False, regex=True).to_numpy()
+
+    return matches
+
+def classify(df, title_column, keyword_column, type_column=None):
+    # Add 'Relevance' (0-1 title relevance to the searched keyword) and 'Contract Type' columns
+    titles = df[title_column].reset_index(drop=True)
+    keywords = df[keyword_column].reset_index(drop=True)
+
+    # Known junk scores 0 unless the title still names the searched role outright
+    relevance = relevance_scores(titles, keywords)
+    relevance = np.where(titles.fillna('').astype(str).str.contains(unrelated_titles).to_numpy(), 0.0, relevance)
+    relevance = np.where(keyword_matches(titles, keywords), 1.0, relevance)
+
+    df = df.copy()
+    df['Relevance'] = relevance
+    df['Contract Type'] = normalize_contract_type(df[type_column]).to_numpy() if type_column else None
+    return df
+
+def filter_postings(df, title_column, keyword_column, type_column=None):
+    # Keep relevant, non full-time postings; adds the normalized 'Contract Type' column
+    if df.empty:
+        return df
+    df = classify(df, title_column, keyword_column, type_column)
+    keep = ((df['Relevance'] >= Config.relevance_threshold) & (df['Contract Type'] != 'Full-time')).to_numpy()
+    dropped = len(df) - keep.sum()
+    if dropped:
+        print(f'Dropped {dropped} irrelevant or full-time postings out of {len(df)}')
+    return df[keep].drop(columns='Relevance')
@@ -1,12 +1,45 @@
 # config.py for zipRecruiter
+import os
 from datetime import datetime
 class Config:
+    # SCRAPER_BASE_URL points every site at a local mock job board (see mock_server.py) instead of the real ones
+    base_url = os.environ.get("SCRAPER_BASE_URL")
+
     proxy = "http://4985462b823f2071f48ff52fb687708658d0d488:@proxy.zenrows.com:8001"
+    # Comma separated SCRAPER_PROXIES replaces the default exit, e.g. with local stand-in proxies
+    if "SCRAPER_PROXIES" in os.environ:
+        proxies = os.environ["SCRAPER_PROXIES"].split(",")
+    else:
+        proxies = [None if base_url else proxy]
+    proxy_max_concurrency = 5
+    proxy_max_failures = 3
+    # First ejection lasts proxy_eject_seconds and doubles on every repeat up to proxy_eject_max_seconds;
+    # the last usable proxy is only ever held back for proxy_last_backoff_seconds
+    proxy_eject_seconds = 5
+    proxy_eject_max_seconds = 60
+    proxy_last_backoff_seconds = 1
+    proxy_smoothing = 0.2
+    proxy_health_half_life = 30
+    # Routing weight is ((1 - error rate) * (1 - block rate)) ** exponent / (latency + floor);
+    # the floor keeps near-identical fast proxies sharing traffic evenly
+    proxy_health_exponent = 4
+    proxy_latency_floor = 0.1
+    proxy_timeout = 30
+    # A request that errors, gets a 5xx or is blocked is sent again up to proxy_retries times, through another proxy where possible
+    proxy_retries = 3
     
-    url_zip = "https://www.ziprecruiter.com/jobs-search"
-    url_indeed = "https://www.indeed.com/jobs?q={keyword}&sc=0kf%3Ajt%28contract%29%3B&page={page}"
-    url_career = "https://www.careerbuilder.com/jobs?cb_apply=false&cb_workhome=all&emp=jtct%2Cjtc2%2Cjtcc&keywords={keyword}&location=&pay=&posted=&sort=date_desc&page={page}"
-    url_dice = "https://job-search-api.svc.dhigroupinc.com/v1/dice/jobs/search"
+    base_url_zip = f"{base_url}/ziprecruiter" if base_url else "https://www.ziprecruiter.com"
+    base_url_indeed = f"{base_url}/indeed" if base_url else "https://www.indeed.com"
+    base_url_career = f"{base_url}/careerbuilder" if base_url else "https://www.careerbuilder.com"
+    base_url_dice = f"{base_url}/dice" if base_url else "https://job-search-api.svc.dhigroupinc.com"
+
+    url_zip = base_url_zip + "/jobs-search"
+    url_indeed = base_url_indeed + "/jobs?q={keyword}&sc=0kf%3Ajt%28contract%29%3B&page={page}"
+    url_career = base_url_career + "/jobs?cb_apply=false&cb_workhome=all&emp=jtct%2Cjtc2%2Cjtcc&keywords={keyword}&location=&pay=&posted=&sort=date_desc&page={page}"
+    url_dice = base_url_dice + "/v1/dice/jobs/search"
+
+    # Pause between CareerBuilder pages; not needed against the mock board
+    request_delay = 0 if base_url else 5
     
     USER_AGENT_LIST = [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
@@ -28,8 +61,22 @@ class Config:
     
     search_type = "1"
     
-    output_directory = "output"
+    output_directory = os.environ.get("SCRAPER_OUTPUT_DIR", "output")
     subdirectory = datetime.now().strftime('%Y-%m-%d')
-    output_csv_path1 = f"output/{datetime.now().strftime('%Y-%m-%d')}"
+    output_csv_path1 = f"{output_directory}/{datetime.now().strftime('%Y-%m-%d')}"
     output_csv_path2 = f"{output_directory}/{subdirectory}"
-    keywords = ["Data Analyst", "Business Analyst", "System Analyst", "Data Scientists", "Data engineer", "Business System Analyst"]
\ No newline at end of file
+    keywords = ["Data Analyst", "Business Analyst", "System Analyst", "Data Scientists", "Data engineer", "Business System Analyst"]
+
+    output_csv_changefeed = "changefeed.csv"
+    changefeed_chunksize = 50000
+
+    # Title relevance (0-1) below which a posting is dropped, and hashed feature space of the relevance model.
+    # Relevance is the share of the keyword's words a title covers, a title word covering a keyword word when their
+    # character trigrams are at least word_match_similarity alike (so "Anlyst" or "Analysis" still count).
+    # Generic role words only count once a distinctive keyword word matched too: "Software Engineer" scores 0 for "Data engineer"
+    relevance_threshold = 0.6
+    word_match_similarity = 0.5
+    generic_title_words = ['analyst', 'engineer', 'scientist', 'developer', 'consultant', 'specialist', 'manager', 'architect']
+    classifier_features = 2 ** 18
+    # Title patterns that keyword searches drag in on the real boards but are never what we are looking for
+    unrelated_title_patterns = [r'behavior analyst', r'\bbcba\b', r'\bbcaba\b']
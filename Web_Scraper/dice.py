@@ -2,6 +2,8 @@ import os
 import requests
 import pandas as pd
 from config import Config
+from proxy_pool import ProxyPool
+from classifier import filter_postings
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 
@@ -9,6 +11,8 @@ class Wrapper:
     def __init__(self):
         # Initialize the class with configuration settings
         self.config = Config()
+        # The Dice API is called without the scraping proxy, so the pool holds a single direct connection
+        self.pool = ProxyPool([None])
 
     def parse_url(self, url):
         # Parse URL and extract relevant parameters
@@ -30,20 +34,22 @@ class Wrapper:
         # Create the output directory if it doesn't exist
         output_path = os.path.join(self.config.output_csv_path2, self.config.output_csv_dice)
         os.makedirs(self.config.output_csv_path2, exist_ok=True)
+        all_dfs = []
 
         for keyword in self.config.keywords:
             params = self.get_params(keyword)
 
-            response = requests.get(
-                self.config.url_dice,
-                params=params,
-                headers=self.config.HEADERS,
-                timeout=30,
-            ).json()
-
+            # A failed request or a non-JSON body (429/5xx error page) only skips this keyword,
+            # so the postings already collected for the others are still written
             try:
-                data = response["data"]
-            except Exception as e:
+                response = self.pool.get(
+                    self.config.url_dice,
+                    params=params,
+                    headers=self.config.HEADERS,
+                    timeout=30,
+                )
+                data = response.json()["data"]
+            except (requests.RequestException, ValueError, KeyError, TypeError) as e:
                 print(f"Sorry could not get the data for {keyword}: {e}")
                 continue
 
@@ -55,12 +61,22 @@ class Wrapper:
                 df1.rename(columns=self.get_column_mapping(), inplace=True)
                 df1['Current date time'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
                 df1['Work type(remote/on-site)'] = df1.apply(self.fill_location, axis=1)
-                df1['Job Title'] = keyword  # Add a new column for the job title
-                df1.to_csv(output_path, mode='a', header=not os.path.exists(output_path), index=False)
-                print(f'Successfully saved the data for {keyword}')
+                # Searched term the postings are classified against; in URL search mode that is the URL's q value
+                df1['Job Title'] = params.get('q') or keyword
+                all_dfs.append(df1)
+                print(f'Successfully got the data for {keyword}')
             else:
                 print(f"Sorry we can't get the data for {keyword}. Please try again with correct url or keywords")
 
+        if not all_dfs:
+            return
+
+        # Classify every keyword's postings in one pass and write the day's file once, like the other sites,
+        # so the header always matches the columns
+        final_df = filter_postings(pd.concat(all_dfs, ignore_index=True), 'Job title', 'Job Title', 'Job type')
+        final_df.to_csv(output_path, index=False)
+        print(f'Successfully saved the data to {output_path}')
+
     def get_params(self, keyword):
         # Get parameters based on search type
         if self.config.search_type == '1':
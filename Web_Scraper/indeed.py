@@ -9,6 +9,8 @@ import pandas as pd
 from datetime import datetime
 from bs4 import BeautifulSoup
 from config import Config
+from proxy_pool import ProxyPool
+from classifier import filter_postings
 from urllib.parse import urlparse, parse_qs
 warnings.filterwarnings('ignore')
 
@@ -119,9 +121,9 @@ def get_data(soup):
 
         df['Current Date Time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         df['Remote / Hybrid'] = df.apply(fill_location, axis=1)
-        df['view_job_link'] = 'https://www.indeed.com' + df['view_job_link']
+        df['view_job_link'] = Config.base_url_indeed + df['view_job_link']
         df.rename(columns=column_mapping, inplace=True)
-        df.drop(columns='Job Location', axis=1, inplace=True)
+        df.drop(columns='Job Location', inplace=True)
         all_inner_dfs.append(df)
 
     dfs = pd.concat(all_inner_dfs, ignore_index=True)
@@ -133,6 +135,7 @@ subdirectory = Config.subdirectory
 os.makedirs(os.path.join(output_directory, subdirectory), exist_ok=True)
 
 all_outer_dfs = []
+pool = ProxyPool(Config.proxies)
 
 for keyword in Config.keywords:
     Config.keyword = keyword
@@ -140,12 +143,10 @@ for keyword in Config.keywords:
     for i in range(0, 120, 10):
         url = Config.url_indeed.format(keyword=Config.keyword, page=i)
         user_agent = random.choice(Config.USER_AGENT_LIST)
-        proxy = Config.proxy
-        proxies = {"http": proxy, "https": proxy}
         headers = {'User-Agent': user_agent}
 
         try:
-            response = requests.get(url, headers=headers, proxies=proxies, verify=False)
+            response = pool.get(url, headers=headers, verify=False)
             response.raise_for_status()
             print('Success!')
 
@@ -153,6 +154,7 @@ for keyword in Config.keywords:
             df1 = get_data(soup)
 
             if df1 is not None:
+                df1['Keyword'] = keyword
                 all_outer_dfs.append(df1)
                 print(f'Success for page {i} - {Config.keyword}')
             else:
@@ -163,7 +165,8 @@ for keyword in Config.keywords:
             print(f"Sorry, the website blocked your connection or there was another error. Status Code: {response.status_code}")
 
 final_df = pd.concat(all_outer_dfs, ignore_index=True)
-final_df = final_df[final_df['Job Type'] != 'Full-time']
+final_df = filter_postings(final_df, 'Title', 'Keyword', 'Job Type')
+final_df.drop(columns='Keyword', inplace=True)
 final_df.drop_duplicates(inplace=True)
 
 # Set up output path
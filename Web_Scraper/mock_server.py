@@ -0,0 +1,333 @@
+import os
+import json
+import time
+import zlib
+import random
+import argparse
+import threading
+import requests
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Local stand-in for the job boards. Every site lives under its own prefix so that
+# Config.base_url can point all scrapers at one server (see benchmark.py):
+#   /indeed/jobs                 -> page with the `mosaic-data` script
+#   /ziprecruiter/jobs-search    -> page with `js_variables` and `job_results_headline`
+#   /careerbuilder/jobs          -> page with `collapsed-activated` listings
+#   /dice/v1/dice/jobs/search    -> search API JSON
+
+companies = ['Nesco Resource', 'Mindlance', 'TalentBurst, Inc.', 'eTeam Inc', 'SGS Consulting', 'Roc Search', 'Techgene Solutions LLC']
+cities = [('Austin', 'TX'), ('Nashville', 'TN'), ('Irving', 'TX'), ('Des Plaines', 'IL'), ('Saint Paul', 'MN'), ('Newport Beach', 'CA')]
+# Titles keyword searches drag in that have nothing to do with the keyword. Deliberately disjoint from
+# Config.unrelated_title_patterns so the benchmark measures the relevance model rather than the deny list;
+# some share a word with the keywords (Financial Analyst, Software Engineer) to make the model work for it
+unrelated_titles = [
+    'Laboratory Technician', 'Project Coordinator', 'Material Handler', 'Salesforce Architect',
+    'Accounts Receivable Analyst', 'Financial Analyst', 'Software Engineer', 'Manufacturing Engineer',
+    'Quality Control Lab Tech', 'Customer Service Specialist',
+]
+
+# Employment type labels as each site spells them: contract, full-time, part-time
+job_type_labels = {
+    'indeed': ['Contract', 'Full-time', 'Part-time'],
+    'ziprecruiter': ['Contractor', 'Full-Time', 'Part-Time'],
+    'careerbuilder': ['Contractor', 'Full-Time', 'Part-Time'],
+    'dice': ['Contract', 'Full-time', 'Part-time'],
+}
+
+# Postings per page and number of postings each keyword has on the site
+page_sizes = {'indeed': 10, 'ziprecruiter': 20, 'careerbuilder': 25, 'dice': 100}
+total_range = (15, 300)
+
+def seeded_random(*parts):
+    # Same site/keyword/page always gives the same postings, so runs can be diffed
+    return random.Random(zlib.crc32('|'.join(str(p) for p in parts).encode()))
+
+def make_postings(site, keyword, start, count):
+    # Synthetic postings for one page of results
+    total = seeded_random(site, keyword).randint(*total_range)
+    postings = []
+
+    for position in range(start, min(start + count, total)):
+        rng = seeded_random(site, keyword, position)
+        city, state = rng.choice(cities)
+        low = rng.randint(25, 80)
+
+        if rng.random() < 0.2:
+            title = rng.choice(unrelated_titles)
+        else:
+            title = rng.choice(['{}', 'Senior {}', '{} II', 'Lead {}', '{} (Contract)']).format(keyword)
+
+        postings.append({
+            'id': f'{rng.getrandbits(64):016x}',
+            'title': title,
+            'company': rng.choice(companies),
+            'city': city,
+            'state': state,
+            'remote': rng.random() < 0.3,
+            'job_type': rng.choices(job_type_labels[site], weights=[75, 15, 10])[0],
+            'pay_min': low,
+            'pay_max': low + rng.randint(0, 20),
+            'days_ago': rng.randint(0, 14),
+        })
+
+    return total, postings
+
+def indeed_page(query):
+    keyword = query.get('q', [''])[0]
+    # Past the end of the results Indeed keeps serving its last page rather than an empty one
+    total = seeded_random('indeed', keyword).randint(*total_range)
+    start = min(int(query.get('page', ['0'])[0]), (total - 1) // page_sizes['indeed'] * page_sizes['indeed'])
+    total, postings = make_postings('indeed', keyword, start, page_sizes['indeed'])
+    results = [{
+        'company': p['company'],
+        'formattedLocation': 'Remote' if p['remote'] else f"{p['city']}, {p['state']}",
+        'remoteLocation': p['remote'],
+        'extractedSalary': {'min': p['pay_min'], 'max': p['pay_max'], 'type': 'HOURLY'},
+        'estimatedSalary': None,
+        'jobkey': p['id'],
+        'pubDate': int((datetime.now() - timedelta(days=p['days_ago'])).timestamp() * 1000),
+        'taxonomyAttributes': [{'label': 'job-types', 'attributes': [{'label': p['job_type']}]}],
+        'viewJobLink': f"/viewjob?jk={p['id']}",
+        'title': p['title'],
+    } for p in postings]
+    data = {'metaData': {'mosaicProviderJobCardsModel': {'results': results}}}
+    script = f'window.mosaic.providerData["mosaic-provider-jobcards"]={json.dumps(data)};'
+    return f'<html><body><script id="mosaic-data" type="text/javascript">{script}</script></body></html>'
+
+def ziprecruiter_page(query, base_url):
+    keyword = query.get('search', [''])[0]
+    page = int(query.get('page', ['1'])[0])
+    total, postings = make_postings('ziprecruiter', keyword, (page - 1) * page_sizes['ziprecruiter'], page_sizes['ziprecruiter'])
+    job_list = [{
+        'Title': p['title'],
+        'City': 'Remote Nationwide' if p['remote'] else p['city'],
+        'FormattedSalaryShort': f"${p['pay_min']} - ${p['pay_max']} / hr",
+        'EmploymentType': p['job_type'],
+        'EmploymentTags': {'remote': p['remote']},
+        'JobURL': f"{base_url}/c/{p['company'].replace(' ', '-')}/Job/{p['title'].replace(' ', '-')}/-in-{p['city'].replace(' ', '-')},{p['state']}?jid={p['id']}",
+        'SaveJobURL': f"{base_url}/job/save?company={p['company'].replace(' ', '+')}&posted_time={(datetime.now() - timedelta(days=p['days_ago'])).strftime('%Y-%m-%dT08:00:00Z')}",
+    } for p in postings]
+    return (
+        '<html><body>'
+        f'<div class="job_results_headline"><h1>{total} {keyword} Jobs</h1></div>'
+        f'<script id="js_variables" type="application/json">{json.dumps({"jobList": job_list})}</script>'
+        '</body></html>'
+    )
+
+def careerbuilder_page(query):
+    keyword = query.get('keywords', [''])[0]
+    page = int(query.get('page', ['0'])[0])
+    total, postings = make_postings('careerbuilder', keyword, page * page_sizes['careerbuilder'], page_sizes['careerbuilder'])
+    listings = ''.join(
+        '<li class="data-results-content-parent relative bg-shadow">'
+        f'<a class="data-results-content" href="/job/{p["id"].upper()}">'
+        f'<div class="data-results-publish-time">{"Today" if p["days_ago"] == 0 else str(p["days_ago"]) + " days ago"}</div>'
+        f'<div class="data-results-title">{p["title"]}</div>'
+        f'<div class="data-details"><span>{p["company"]}</span>'
+        f'<span>{p["city"]}, {p["state"]} ({"Remote" if p["remote"] else "Onsite"})</span>'
+        f'<span>{p["job_type"]}</span></div>'
+        f'<div class="block">${p["pay_min"]}.00 - ${p["pay_max"]}.00/Hour</div>'
+        '</a></li>'
+        for p in postings
+    )
+    return f'<html><body><div class="collapsed-activated"><ol>{listings}</ol></div></body></html>'
+
+def dice_search(query):
+    keyword = query.get('q', [''])[0]
+    page = int(query.get('page', ['1'])[0])
+    page_size = int(query.get('pageSize', [page_sizes['dice']])[0])
+    total, postings = make_postings('dice', keyword, (page - 1) * page_size, page_size)
+    data = [{
+        'id': p['id'],
+        'title': p['title'],
+        'postedDate': (datetime.now() - timedelta(days=p['days_ago'])).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'modifiedDate': (datetime.now() - timedelta(days=p['days_ago'])).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'detailsPageUrl': f"https://www.dice.com/job-detail/{p['id']}",
+        'jobLocation': {'displayName': f"{p['city']}, {p['state']}, USA"},
+        'salary': f"${p['pay_min']} - ${p['pay_max']}",
+        'companyName': p['company'],
+        'employmentType': p['job_type'],
+        'workFromHomeAvailability': 'TRUE' if p['remote'] else 'FALSE',
+        'isRemote': p['remote'],
+    } for p in postings]
+    return json.dumps({'data': data, 'meta': {'currentPage': page, 'pageSize': page_size, 'totalResults': total}})
+
+class MockJobBoard:
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, error_rate=0.0, rate_429=0.0, fixtures=None, seed=None):
+        # Initialize the board with its fault injection settings; port 0 picks a free port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.fixtures = fixtures
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.server = ThreadingHTTPServer((host, port), self.make_handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def record(self, site, status):
+        with self.lock:
+            site_stats = self.stats.setdefault(site, {})
+            site_stats[status] = site_stats.get(status, 0) + 1
+
+    def fixture(self, site):
+        # A recorded page for the site, if one was given, is served instead of synthetic data
+        if not self.fixtures:
+            return None
+        for extension in ('html', 'json'):
+            path = os.path.join(self.fixtures, f'{site}.{extension}')
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    return f.read()
+        return None
+
+    def respond(self, path, query):
+        # Return (site, status, content type, body) for one request
+        site = path.strip('/').split('/')[0]
+        if site not in page_sizes:
+            return site, 404, 'text/plain', 'Not found'
+
+        time.sleep(self.latency * self.random.uniform(0.5, 1.5))
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.rate_429:
+            return site, 429, 'text/plain', 'Too Many Requests'
+        if roll < self.rate_429 + self.error_rate:
+            return site, 500, 'text/plain', 'Internal Server Error'
+
+        content_type = 'application/json' if site == 'dice' else 'text/html'
+        body = self.fixture(site)
+        if body is None:
+            if site == 'indeed':
+                body = indeed_page(query)
+            elif site == 'ziprecruiter':
+                body = ziprecruiter_page(query, f'{self.base_url}/ziprecruiter')
+            elif site == 'careerbuilder':
+                body = careerbuilder_page(query)
+            else:
+                body = dice_search(query)
+        return site, 200, content_type, body
+
+    def make_handler(self):
+        board = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                site, status, content_type, body = board.respond(parsed.path, parse_qs(parsed.query))
+                board.record(site, status)
+                payload = body.encode('utf-8')
+
+                self.send_response(status)
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                if status == 429:
+                    self.send_header('Retry-After', '1')
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                # Keep the console quiet under load
+                pass
+
+        return Handler
+
+class StandInProxy:
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, fail_status=None, hang=False):
+        # Local forwarding HTTP proxy for exercising ProxyPool. fail_status answers every request with
+        # that status instead of forwarding, hang holds requests open; both can be flipped while running
+        self.latency = latency
+        self.fail_status = fail_status
+        self.hang = hang
+        self.forwarded = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.server = ThreadingHTTPServer((host, port), self.make_handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        self.stopped.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def forward(self, url):
+        # Return (status, headers, body) for one proxied request
+        if self.hang:
+            self.stopped.wait(60)
+        time.sleep(self.latency)
+        if self.fail_status:
+            return self.fail_status, {}, b'Proxy failure'
+
+        session = requests.Session()
+        session.trust_env = False
+        response = session.get(url, timeout=30)
+        with self.lock:
+            self.forwarded += 1
+        headers = {k: v for k, v in response.headers.items() if k in ('Content-Type', 'Retry-After')}
+        return response.status_code, headers, response.content
+
+    def make_handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                # Proxied requests carry the absolute target URL as their path
+                status, headers, body = proxy.forward(self.path)
+                try:
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on a hung request
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve synthetic job board pages for offline load testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help='mean response delay in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with 500')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='share of requests answered with 429')
+    parser.add_argument('--fixtures', help='directory with recorded <site>.html / dice.json pages to serve instead')
+    args = parser.parse_args()
+
+    board = MockJobBoard(args.host, args.port, args.latency, args.error_rate, args.rate_429, args.fixtures)
+    print(f'Serving mock job boards on {board.base_url} (set SCRAPER_BASE_URL to this to point the scrapers at it)')
+    try:
+        board.server.serve_forever()
+    except KeyboardInterrupt:
+        board.stop()
@@ -0,0 +1,116 @@
+import time
+from mock_server import MockJobBoard, StandInProxy
+from config import Config
+from proxy_pool import ProxyPool
+
+# Exercises ProxyPool end to end through local stand-in proxies in front of the mock job board:
+# retries through another exit, recovery of a failing proxy, ejection and trial requests, the last proxy never being
+# ejected for long, hung exits and slots freed whatever the request raises
+
+def search_url(base_url):
+    return f'{base_url}/dice/v1/dice/jobs/search?q=Data%20Analyst&page=1&pageSize=5'
+
+def check_failing_proxy_recovers(base_url):
+    # A proxy failing at the start gets little traffic while it fails and a fair share again once it heals
+    flaky, healthy = StandInProxy(fail_status=502), StandInProxy()
+    pool = ProxyPool([flaky.start(), healthy.start()], eject_seconds=0.2)
+
+    # Every request still succeeds while the flaky proxy fails, because failures are retried through the healthy one
+    for _ in range(50):
+        assert pool.get(search_url(base_url)).status_code == 200
+    assert healthy.forwarded == 50, f'healthy proxy only carried {healthy.forwarded} of 50 requests'
+
+    flaky.fail_status = None
+    time.sleep(0.3)
+    for _ in range(200):
+        assert pool.get(search_url(base_url)).status_code == 200
+    assert flaky.forwarded >= 40, f'recovered proxy only carried {flaky.forwarded} of 200 requests'
+
+    flaky.stop()
+    healthy.stop()
+    return f'recovered proxy carried {flaky.forwarded} of 200 requests once it healed'
+
+def check_ejection_and_trial(base_url):
+    # With every exit failing, all but the last usable proxy are ejected; once healed they come back through a trial request
+    proxies = [StandInProxy(fail_status=502) for _ in range(3)]
+    pool = ProxyPool([p.start() for p in proxies], eject_seconds=0.5)
+
+    for _ in range(3):
+        assert pool.get(search_url(base_url)).status_code == 502
+    ejected = sum(s.ejections > 0 for s in pool.stats)
+    assert ejected == 2, f'{ejected} of 3 failing proxies ejected, expected all but the last'
+
+    for p in proxies:
+        p.fail_status = None
+    time.sleep(1.1)
+    for _ in range(60):
+        assert pool.get(search_url(base_url)).status_code == 200
+    assert all(p.forwarded for p in proxies), 'an ejected proxy never came back'
+    assert not any(r['ejected'] for r in pool.report())
+
+    for p in proxies:
+        p.stop()
+    return f'2 of 3 failing proxies ejected; after healing they carried {[p.forwarded for p in proxies]} of 60 requests'
+
+def check_last_proxy_backoff(base_url):
+    # With a single proxy and a site answering 429, the pool only pauses briefly per failure instead of ejecting it,
+    # and hands the 429 back once every retry is used up
+    only = StandInProxy(fail_status=429)
+    pool = ProxyPool([only.start()])
+    attempts = 2 * (Config.proxy_retries + 1)
+
+    start = time.monotonic()
+    for _ in range(2):
+        assert pool.get(search_url(base_url)).status_code == 429
+    elapsed = time.monotonic() - start
+    assert pool.stats[0].requests == attempts, f'{pool.stats[0].requests} attempts through the only proxy, expected {attempts}'
+    assert elapsed < attempts * Config.proxy_last_backoff_seconds + 1, f'{attempts} blocked attempts through the only proxy took {elapsed:.1f}s'
+
+    only.stop()
+    return f'{attempts} blocked attempts through the only proxy took {elapsed:.1f}s'
+
+def check_hung_proxy(base_url):
+    # A proxy that never answers is timed out, recorded as a failure, its slot freed and the request retried elsewhere
+    hung, healthy = StandInProxy(hang=True), StandInProxy()
+    pool = ProxyPool([hung.start(), healthy.start()], max_concurrency=1)
+
+    for _ in range(10):
+        assert pool.get(search_url(base_url), timeout=0.3).status_code == 200
+    hung_stats = next(s for s in pool.stats if s.proxy == hung.url)
+    assert hung_stats.requests >= 1 and hung_stats.in_flight == 0, 'hung proxy kept its slot'
+    assert healthy.forwarded == 10
+
+    hung.stop()
+    healthy.stop()
+    return f'{hung_stats.requests} request(s) timed out on the hung proxy and were retried through the healthy one'
+
+def check_slot_released_on_any_error(base_url):
+    # An exception that is not a requests error still frees the slot, so acquire() never blocks forever
+    pool = ProxyPool([None], max_concurrency=1)
+    session_request = pool.session.request
+
+    def broken_request(*args, **kwargs):
+        raise RuntimeError('broken adapter')
+    pool.session.request = broken_request
+
+    for _ in range(3):
+        try:
+            pool.get(search_url(base_url))
+        except RuntimeError:
+            pass
+    assert pool.stats[0].in_flight == 0, 'a non-requests exception leaked the slot'
+
+    pool.session.request = session_request
+    assert pool.get(search_url(base_url)).status_code == 200
+    return f'slot freed after {pool.stats[0].requests - 1} non-requests errors'
+
+if __name__ == "__main__":
+    board = MockJobBoard()
+    base_url = board.start()
+
+    for check in (check_failing_proxy_recovers, check_ejection_and_trial, check_last_proxy_backoff, check_hung_proxy,
+                  check_slot_released_on_any_error):
+        print(f'{check.__name__}: {check(base_url)}')
+
+    board.stop()
+    print('All proxy pool checks passed')
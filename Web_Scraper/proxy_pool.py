@@ -0,0 +1,186 @@
+import time
+import random
+import threading
+import requests
+from config import Config
+
+# Status codes that mean the exit was recognised and refused, not that the site failed
+BLOCK_STATUS_CODES = (403, 407, 429)
+
+def parse_retry_after(response):
+    # Seconds from a Retry-After header; the HTTP-date form is ignored
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+class ProxyStats:
+    def __init__(self, proxy):
+        # Rolling health figures for a single proxy (None means a direct connection)
+        self.proxy = proxy
+        self.latency = None
+        self.error_rate = 0.0
+        self.block_rate = 0.0
+        self.updated_at = time.monotonic()
+        self.requests = 0
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        # Set while the proxy is coming back from ejection and has not yet served a good request
+        self.trial = False
+
+    def decay(self, now):
+        # Error and block rates fade with time, so a proxy that stops getting traffic is not stuck with them
+        factor = 0.5 ** ((now - self.updated_at) / Config.proxy_health_half_life)
+        self.error_rate *= factor
+        self.block_rate *= factor
+        self.updated_at = now
+
+    def weight(self, now):
+        # Higher is healthier: success odds sharpened by Config.proxy_health_exponent, over latency.
+        # Untried proxies count as fast and healthy so every exit gets sampled early
+        factor = 0.5 ** ((now - self.updated_at) / Config.proxy_health_half_life)
+        health = ((1 - factor * self.error_rate) * (1 - factor * self.block_rate)) ** Config.proxy_health_exponent
+        latency = self.latency if self.latency is not None else 0.0
+        return health / (latency + Config.proxy_latency_floor)
+
+    def as_dict(self, now):
+        factor = 0.5 ** ((now - self.updated_at) / Config.proxy_health_half_life)
+        return {
+            'proxy': self.proxy,
+            'requests': self.requests,
+            'latency': self.latency,
+            'error_rate': round(self.error_rate * factor, 3),
+            'block_rate': round(self.block_rate * factor, 3),
+            'ejected': self.ejected_until > now,
+        }
+
+class ProxyPool:
+    def __init__(self, proxies, max_concurrency=None, max_failures=None, eject_seconds=None, smoothing=None):
+        # Initialize the pool with one stats record per proxy and the health settings from Config
+        if not proxies:
+            raise ValueError("ProxyPool needs at least one proxy")
+        self.stats = [ProxyStats(proxy) for proxy in proxies]
+        self.max_concurrency = max_concurrency or Config.proxy_max_concurrency
+        self.max_failures = max_failures or Config.proxy_max_failures
+        self.eject_seconds = eject_seconds if eject_seconds is not None else Config.proxy_eject_seconds
+        self.smoothing = smoothing or Config.proxy_smoothing
+        self.condition = threading.Condition()
+        self.session = requests.Session()
+
+    def acquire(self, avoid=()):
+        # Block until a proxy is under its concurrency cap and not ejected, then pick one at random weighted
+        # towards the healthiest and least busy. Weaker proxies keep a trickle of traffic so they can recover.
+        # A proxy back from ejection gets a single trial request before it competes on weight again.
+        # Proxies in avoid (already tried for this request) are only used when nothing else is free
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                available = [
+                    s for s in self.stats
+                    if s.ejected_until <= now and s.in_flight < self.max_concurrency and not (s.trial and s.in_flight)
+                ]
+                available = [s for s in available if s not in avoid] or available
+                if available:
+                    trials = [s for s in available if s.trial]
+                    if trials:
+                        stats = trials[0]
+                    else:
+                        weights = [s.weight(now) / (1 + s.in_flight) for s in available]
+                        stats = random.choices(available, weights=weights)[0]
+                    stats.in_flight += 1
+                    return stats
+
+                # Wake up when the first ejected proxy comes back, or when a request finishes
+                ejected = [s.ejected_until for s in self.stats if s.ejected_until > now]
+                self.condition.wait(timeout=min(ejected) - now if ejected else None)
+
+    def eject(self, stats, now, retry_after=None):
+        # Take a failing proxy out for an exponentially growing cool-down, or for as long as the
+        # site asked with Retry-After. The last usable proxy is never taken out, only held back briefly
+        delay = retry_after if retry_after is not None else self.eject_seconds * 2 ** stats.ejections
+        delay = min(delay, Config.proxy_eject_max_seconds)
+        others = [s for s in self.stats if s is not stats and s.ejected_until <= now]
+
+        if others:
+            stats.ejections += 1
+        else:
+            delay = min(delay, Config.proxy_last_backoff_seconds)
+
+        stats.ejected_until = now + delay
+        stats.consecutive_failures = 0
+        stats.trial = True
+        print(f"Ejecting proxy {stats.proxy} for {delay:.1f}s after repeated failures")
+
+    def release(self, stats, latency, status_code=None, retry_after=None):
+        # Fold the outcome of one request into the proxy's moving averages
+        blocked = status_code in BLOCK_STATUS_CODES
+        failed = status_code is None or status_code >= 500
+
+        with self.condition:
+            now = time.monotonic()
+            stats.decay(now)
+            stats.in_flight -= 1
+            stats.requests += 1
+            stats.latency = latency if stats.latency is None else stats.latency + self.smoothing * (latency - stats.latency)
+            stats.error_rate += self.smoothing * (failed - stats.error_rate)
+            stats.block_rate += self.smoothing * (blocked - stats.block_rate)
+
+            if blocked or failed:
+                stats.consecutive_failures += 1
+                if stats.trial or stats.consecutive_failures >= self.max_failures:
+                    self.eject(stats, now, retry_after)
+            else:
+                stats.consecutive_failures = 0
+                if stats.trial:
+                    # Passed its trial: back in rotation with a clean record
+                    stats.trial = False
+                    stats.ejections = 0
+                    stats.error_rate = 0.0
+                    stats.block_rate = 0.0
+
+            self.condition.notify_all()
+
+    def request(self, method, url, **kwargs):
+        # Send a request through the healthiest proxy and record how it went. Connection errors, 5xx and
+        # blocks are retried up to Config.proxy_retries times, each time through a proxy not yet tried if one is free;
+        # the last response is returned (or the last error raised) once every attempt is used up
+        kwargs.setdefault('timeout', Config.proxy_timeout)
+        tried = []
+
+        for attempt in range(Config.proxy_retries + 1):
+            stats = self.acquire(avoid=tried)
+            tried.append(stats)
+            proxies = {"http": stats.proxy, "https": stats.proxy} if stats.proxy else None
+            start = time.monotonic()
+            response = None
+
+            # The slot is always given back; anything that is not a response counts as a failure
+            try:
+                response = self.session.request(method, url, proxies=proxies, **kwargs)
+            except requests.RequestException:
+                if attempt == Config.proxy_retries:
+                    raise
+            finally:
+                if response is None:
+                    self.release(stats, time.monotonic() - start)
+                else:
+                    self.release(stats, time.monotonic() - start, response.status_code, parse_retry_after(response))
+
+            if response is not None:
+                if response.status_code < 500 and response.status_code not in BLOCK_STATUS_CODES:
+                    return response
+                if attempt == Config.proxy_retries:
+                    return response
+                response.close()
+                print(f"Retrying {url} through another proxy after status {response.status_code}")
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def report(self):
+        # Current health of every proxy, healthiest first
+        with self.condition:
+            now = time.monotonic()
+            return [s.as_dict(now) for s in sorted(self.stats, key=lambda s: s.weight(now), reverse=True)]
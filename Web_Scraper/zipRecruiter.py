@@ -8,6 +8,8 @@ import requests
 import numpy as np
 import pandas as pd
 from config import Config
+from proxy_pool import ProxyPool
+from classifier import filter_postings
 from bs4 import BeautifulSoup
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
@@ -118,8 +120,7 @@ user_agent_list = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 13_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15',
 ]
 
-proxy = Config.proxy
-proxies = {"http": proxy, "https": proxy}
+pool = ProxyPool(Config.proxies)
 
 output_directory = Config.output_directory
 subdirectory = Config.subdirectory
@@ -129,10 +130,10 @@ all_dfs = []
 
 for keyword in Config.keywords:
     Config.keyword = keyword
-    url = f'https://www.ziprecruiter.com/jobs-search?search={keyword}&location=&company=&refine_by_location_type=&radius=&days=&refine_by_salary=&refine_by_employment=employment_type%3Aemployment_type%3Acontract&'
+    url = f'{Config.url_zip}?search={keyword}&location=&company=&refine_by_location_type=&radius=&days=&refine_by_salary=&refine_by_employment=employment_type%3Aemployment_type%3Acontract&'
     user_agent = random.choice(Config.USER_AGENT_LIST)
     headers = {'User-Agent': user_agent}
-    response = requests.get(url, headers=headers, proxies=proxies, verify=False)
+    response = pool.get(url, headers=headers, verify=False)
 
     if response.status_code == 200:
         # Do something with the response here
@@ -140,20 +141,24 @@ for keyword in Config.keywords:
     else:
         # Print an error message
         print(f"Sorry, the website blocked your connection. Status Code: {response.status_code}")
+        # Every retry failed; an error page has no results headline to read, so move on to the next keyword
+        continue
 
     soup = BeautifulSoup(response.content, 'html.parser')
     a = BeautifulSoup(str(soup.find('div', class_='job_results_headline')), 'html.parser').find('h1').get_text(strip=True)
     result = int(extract_digits(a))
     df1 = get_data(soup)
+    if df1 is not None:
+        df1['Keyword'] = keyword
     all_dfs.append(df1)
 
     if 20 < result < 100:
         for j in range(2, 4):
-            url2 = f'https://www.ziprecruiter.com/jobs-search?search={keyword}&location=&company=&refine_by_location_type=&radius=&days=&refine_by_salary=&refine_by_employment=employment_type%3Aemployment_type%3Acontract&page={j}'
+            url2 = f'{Config.url_zip}?search={keyword}&location=&company=&refine_by_location_type=&radius=&days=&refine_by_salary=&refine_by_employment=employment_type%3Aemployment_type%3Acontract&page={j}'
 
             user_agent = random.choice(Config.USER_AGENT_LIST)
             headers = {'User-Agent': user_agent}
-            res2 = requests.get(url2, headers=headers, proxies=proxies, verify=False)
+            res2 = pool.get(url2, headers=headers, verify=False)
 
             if res2.status_code == 200:
                 # Do something with the response here
@@ -164,15 +169,17 @@ for keyword in Config.keywords:
 
             soup2 = BeautifulSoup(res2.content, 'html.parser')
             df3 = get_data(soup2)
+            if df3 is not None:
+                df3['Keyword'] = keyword
             all_dfs.append(df3)
             print('success for page ' + str(j))
     elif 100 < result:
         for i in range(2, 7):
-            url1 = f'https://www.ziprecruiter.com/jobs-search?search={keyword}&location=&company=&refine_by_location_type=&radius=&days=&refine_by_salary=&refine_by_employment=employment_type%3Aemployment_type%3Acontract&page={i}'
+            url1 = f'{Config.url_zip}?search={keyword}&location=&company=&refine_by_location_type=&radius=&days=&refine_by_salary=&refine_by_employment=employment_type%3Aemployment_type%3Acontract&page={i}'
 
             user_agent = random.choice(Config.USER_AGENT_LIST)
             headers = {'User-Agent': user_agent}
-            res1 = requests.get(url1, headers=headers, proxies=proxies, verify=False)
+            res1 = pool.get(url1, headers=headers, verify=False)
 
             if res1.status_code == 200:
                 # Do something with the response here
@@ -183,13 +190,16 @@ for keyword in Config.keywords:
 
             soup1 = BeautifulSoup(res1.content, 'html.parser')
             df2 = get_data(soup1)
+            if df2 is not None:
+                df2['Keyword'] = keyword
             all_dfs.append(df2)
             print('success for page ' + str(i))
     else:
         print('This keyword has only this data')
 
 final_df = pd.concat(all_dfs)
-final_df = final_df[final_df['EmploymentType'] != 'Full-Time']
+final_df = filter_postings(final_df, 'Title', 'Keyword', 'EmploymentType')
+final_df.drop(columns='Keyword', inplace=True)
 final_df.drop_duplicates(inplace=True)
 
 final_df